@@ -1,15 +1,20 @@
-from typing import Dict, List, Any
+import time
+
+_PROCESS_START = time.perf_counter()
+
+from typing import Dict, List, Any, Optional
+import argparse
 import json
+from collections import OrderedDict
 from pathlib import Path
-from groq import Groq
 import os
 import random
-from dotenv import load_dotenv
+import threading
+from groq_client import get_groq_client
+from tenants import TenantStorage
 
 class WebsiteChatbot:
     def __init__(self, dataset_path: Path):
-        load_dotenv()
-        self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
         self.dataset = self._load_dataset(dataset_path)
         self.categories = self.dataset.get('metadata', {}).get('categories', [])
         self.qa_pairs = self.dataset.get('categories', {})
@@ -29,6 +34,27 @@ class WebsiteChatbot:
             'quit': 'Goodbye! Hope I was helpful!'
         }
 
+    @property
+    def groq_client(self):
+        return get_groq_client()
+
+    def warm_up(self) -> threading.Thread:
+        """Load the Groq client in the background while dataset answers are served.
+
+        A failure is kept on the returned thread's ``error`` attribute; the
+        first LLM fallback retries and reports it to the user.
+        """
+        def _load():
+            try:
+                self.groq_client
+            except Exception as e:
+                thread.error = e
+
+        thread = threading.Thread(target=_load, daemon=True)
+        thread.error = None
+        thread.start()
+        return thread
+
     def _load_dataset(self, filepath: Path) -> Dict[str, Any]:
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -155,10 +181,105 @@ class WebsiteChatbot:
             response = self.get_response(user_input)
             print(f"\nBot: {response}")
 
+class DatasetRegistry:
+    """Serves chatbots for many tenants from one process.
+
+    Datasets are loaded on a tenant's first request and the least recently
+    used ones are evicted once more than ``max_loaded`` are in memory.
+    """
+
+    def __init__(self, base_dir: Path = Path("data"), max_loaded: int = 64):
+        if max_loaded < 1:
+            raise ValueError("max_loaded must be at least 1")
+        self.base_dir = Path(base_dir)
+        self.max_loaded = max_loaded
+        self._chatbots: "OrderedDict[str, WebsiteChatbot]" = OrderedDict()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tenant_id: str) -> WebsiteChatbot:
+        with self._lock:
+            chatbot = self._lookup(tenant_id)
+            if chatbot is not None:
+                return chatbot
+            loading = self._loading.setdefault(tenant_id, threading.Lock())
+
+        # Load outside the registry lock so one large dataset does not stall
+        # other tenants; concurrent requests for this tenant wait on its lock
+        with loading:
+            with self._lock:
+                chatbot = self._lookup(tenant_id)
+                if chatbot is not None:
+                    return chatbot
+            try:
+                chatbot = WebsiteChatbot(TenantStorage(self.base_dir, tenant_id).dataset_path)
+            except Exception:
+                with self._lock:
+                    self._loading.pop(tenant_id, None)
+                raise
+
+            # Publish the chatbot and retire the loading lock together so no
+            # request can see neither and start a second load
+            with self._lock:
+                self._chatbots[tenant_id] = chatbot
+                while len(self._chatbots) > self.max_loaded:
+                    self._chatbots.popitem(last=False)
+                self._loading.pop(tenant_id, None)
+                return chatbot
+
+    def _lookup(self, tenant_id: str) -> Optional[WebsiteChatbot]:
+        chatbot = self._chatbots.get(tenant_id)
+        if chatbot is not None:
+            self._chatbots.move_to_end(tenant_id)
+        return chatbot
+
+    def get_response(self, tenant_id: str, user_input: str) -> str:
+        return self.get(tenant_id).get_response(user_input)
+
+    def evict(self, tenant_id: str) -> bool:
+        """Drop a tenant's dataset, e.g. after its pipeline regenerated it"""
+        with self._lock:
+            return self._chatbots.pop(tenant_id, None) is not None
+
+    def loaded_tenants(self) -> List[str]:
+        """Loaded tenants, least recently used first"""
+        with self._lock:
+            return list(self._chatbots)
+
+def _report_startup_time(chatbot: WebsiteChatbot):
+    """Print how long the dataset and the LLM backend took to become available.
+
+    Times are measured from when this module starts importing, so interpreter
+    boot is not included.
+    """
+    dataset_ready = time.perf_counter()
+    print(f"Dataset ready in {(dataset_ready - _PROCESS_START) * 1000:.1f} ms")
+
+    warm_up = chatbot.warm_up()
+    warm_up.join()
+    llm_ready = time.perf_counter()
+    if warm_up.error is None:
+        print(f"Groq client ready in {(llm_ready - _PROCESS_START) * 1000:.1f} ms")
+    else:
+        print(f"Groq client unavailable: {type(warm_up.error).__name__}: {warm_up.error}")
+
 def main():
+    parser = argparse.ArgumentParser(description="Chat with a website dataset")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="measure time to serve the dataset and load the LLM, then exit "
+                             "(counted from script import; interpreter boot is excluded)")
+    parser.add_argument("--tenant", help="chat with the dataset stored under data/tenants/<tenant>")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    args = parser.parse_args()
+
     try:
-        dataset_path = Path("data/chatbot_dataset.json")
+        dataset_path = TenantStorage(args.data_dir, args.tenant).dataset_path
         chatbot = WebsiteChatbot(dataset_path)
+        if args.startup_time:
+            _report_startup_time(chatbot)
+            return
+
+        chatbot.warm_up()
         chatbot.start_chat()
         
     except Exception as e:
@@ -1,17 +1,19 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncContextManager, Callable
+import asyncio
+from contextlib import nullcontext
 import json
 from pathlib import Path
-import groq
-import os
-from dotenv import load_dotenv
 from collections import defaultdict
 import re
 from datetime import datetime
+from groq_client import get_groq_client
 class ChatbotDatasetGenerator:
     def __init__(self, processed_data_path: Path):
-        load_dotenv()
-        self.groq_client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
         self.processed_data = self._load_data(processed_data_path)
+
+    @property
+    def groq_client(self):
+        return get_groq_client()
     
     def _load_data(self, filepath: Path) -> Dict:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -76,6 +78,29 @@ class ChatbotDatasetGenerator:
         
         return dict(categorized_data)
     
+    def _generate_block_qa(self, block: Dict) -> List[Dict]:
+        """Ask the LLM for QA pairs covering one context block"""
+        # Limit content size for API
+        content = str(block)[:4000]  # Prevent token limit issues
+
+        response = self.groq_client.chat.completions.create(
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Create natural Q&A pairs for a website chatbot. Format: [{\"question\": \"...\", \"answer\": \"...\"}]"
+                },
+                {
+                    "role": "user",
+                    "content": f"Generate 5 Q&A pairs for this content: {content}"
+                }
+            ],
+            model="mixtral-8x7b-32768",
+            temperature=0.7,
+            max_tokens=1000
+        )
+
+        return json.loads(response.choices[0].message.content)
+
     def generate_dataset(self) -> List[Dict]:
         """Generate QA pairs from context blocks"""
         try:
@@ -85,27 +110,7 @@ class ChatbotDatasetGenerator:
 
             for i, block in enumerate(context_blocks, 1):
                 try:
-                    # Limit content size for API
-                    content = str(block)[:4000]  # Prevent token limit issues
-                    
-                    response = self.groq_client.chat.completions.create(
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "Create natural Q&A pairs for a website chatbot. Format: [{\"question\": \"...\", \"answer\": \"...\"}]"
-                            },
-                            {
-                                "role": "user",
-                                "content": f"Generate 5 Q&A pairs for this content: {content}"
-                            }
-                        ],
-                        model="mixtral-8x7b-32768",
-                        temperature=0.7,
-                        max_tokens=1000
-                    )
-                    
-                    qa_pairs = json.loads(response.choices[0].message.content)
-                    dataset.extend(qa_pairs)
+                    dataset.extend(self._generate_block_qa(block))
                     print(f"Processed block {i}/{len(context_blocks)}")
                     
                 except Exception as e:
@@ -117,10 +122,36 @@ class ChatbotDatasetGenerator:
         except Exception as e:
             print(f"Error generating dataset: {str(e)}")
             return []
-        
-    def generate_categorized_dataset(self) -> Dict[str, Any]:
-        """Generate and categorize dataset"""
-        raw_dataset = self.generate_dataset()
+
+    async def agenerate_dataset(self, llm_slot: Callable[[], AsyncContextManager] = nullcontext) -> List[Dict]:
+        """Generate QA pairs without blocking the event loop.
+
+        ``llm_slot`` is entered around every LLM request so a scheduler can
+        share a limited number of concurrent requests between sites.
+        """
+        try:
+            context_blocks = self._create_context_blocks()
+            dataset = []
+            print(f"Processing {len(context_blocks)} context blocks...")
+
+            for i, block in enumerate(context_blocks, 1):
+                try:
+                    async with llm_slot():
+                        qa_pairs = await asyncio.to_thread(self._generate_block_qa, block)
+                    dataset.extend(qa_pairs)
+                    print(f"Processed block {i}/{len(context_blocks)}")
+
+                except Exception as e:
+                    print(f"Error processing block {i}: {str(e)}")
+                    continue
+
+            return dataset
+
+        except Exception as e:
+            print(f"Error generating dataset: {str(e)}")
+            return []
+
+    def _build_categorized_dataset(self, raw_dataset: List[Dict]) -> Dict[str, Any]:
         categorized_dataset = self._categorize_qa_pairs(raw_dataset)
         
         # Add metadata
@@ -135,6 +166,14 @@ class ChatbotDatasetGenerator:
         
         return final_dataset
 
+    def generate_categorized_dataset(self) -> Dict[str, Any]:
+        """Generate and categorize dataset"""
+        return self._build_categorized_dataset(self.generate_dataset())
+
+    async def agenerate_categorized_dataset(self, llm_slot: Callable[[], AsyncContextManager] = nullcontext) -> Dict[str, Any]:
+        """Async variant of generate_categorized_dataset for concurrent pipelines"""
+        return self._build_categorized_dataset(await self.agenerate_dataset(llm_slot))
+
     def save_categorized_dataset(self, dataset: Dict[str, Any], output_path: Path):
         """Save the categorized dataset"""
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -0,0 +1,18 @@
+import os
+import threading
+
+# One Groq client is shared by every chatbot and pipeline in the process
+_groq_client = None
+_groq_lock = threading.Lock()
+
+def get_groq_client():
+    """Create the Groq client on first use so startup only pays for what it needs"""
+    global _groq_client
+    if _groq_client is None:
+        with _groq_lock:
+            if _groq_client is None:
+                from dotenv import load_dotenv
+                from groq import Groq
+                load_dotenv()
+                _groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    return _groq_client
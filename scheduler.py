@@ -0,0 +1,124 @@
+from typing import Any, Deque, Dict, Optional
+import argparse
+import asyncio
+import json
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from scrape_pipeline import WebsiteChatbotPipeline
+
+class FairSlotPool:
+    """Limits concurrent use of a shared resource (browsers, LLM requests).
+
+    When every slot is busy, waiters are queued per tenant and a freed slot
+    goes to the next waiting tenant in round-robin order, so a site with
+    many requests cannot starve the others.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("Slot pool size must be at least 1")
+        self.size = size
+        self._in_use = 0
+        self._waiters: "OrderedDict[Optional[str], Deque[asyncio.Future]]" = OrderedDict()
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    async def acquire(self, tenant_id: Optional[str]):
+        if self._in_use < self.size and not self._waiters:
+            self._in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(tenant_id, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation, pass it on
+                self.release()
+            else:
+                self._remove_waiter(tenant_id, future)
+            raise
+
+    def release(self):
+        while self._waiters:
+            tenant_id, queue = self._waiters.popitem(last=False)
+            future = queue.popleft()
+            if queue:
+                # Rotate the tenant to the back so other tenants go first
+                self._waiters[tenant_id] = queue
+            if not future.done():
+                # The slot moves straight to the waiter, in_use is unchanged
+                future.set_result(None)
+                return
+        self._in_use -= 1
+
+    def _remove_waiter(self, tenant_id: Optional[str], future: asyncio.Future):
+        queue = self._waiters.get(tenant_id)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[tenant_id]
+
+    @asynccontextmanager
+    async def slot(self, tenant_id: Optional[str]):
+        await self.acquire(tenant_id)
+        try:
+            yield
+        finally:
+            self.release()
+
+class PipelineScheduler:
+    """Runs pipelines for many sites concurrently within shared slot limits"""
+
+    def __init__(self, base_dir: Path = Path("data"), browser_slots: int = 2, llm_slots: int = 4):
+        self.base_dir = Path(base_dir)
+        self.browser_slots = FairSlotPool(browser_slots)
+        self.llm_slots = FairSlotPool(llm_slots)
+
+    async def run_pipeline(self, tenant_id: str, url: str) -> Path:
+        pipeline = WebsiteChatbotPipeline(url, tenant_id=tenant_id, base_dir=self.base_dir)
+        return await pipeline.run(browser_slots=self.browser_slots, llm_slots=self.llm_slots)
+
+    async def run_all(self, sites: Dict[str, str]) -> Dict[str, Any]:
+        """Run every tenant's pipeline and map each tenant to its dataset path or error"""
+        tenant_ids = list(sites)
+        results = await asyncio.gather(
+            *(self.run_pipeline(tenant_id, sites[tenant_id]) for tenant_id in tenant_ids),
+            return_exceptions=True
+        )
+        return dict(zip(tenant_ids, results))
+
+async def main():
+    parser = argparse.ArgumentParser(description="Build chatbot datasets for many websites")
+    parser.add_argument("sites", type=Path, help="JSON file mapping tenant ids to website URLs")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    parser.add_argument("--browser-slots", type=int, default=2,
+                        help="maximum number of browsers scraping at once")
+    parser.add_argument("--llm-slots", type=int, default=4,
+                        help="maximum number of LLM requests in flight at once")
+    args = parser.parse_args()
+
+    try:
+        with open(args.sites, 'r', encoding='utf-8') as f:
+            sites = json.load(f)
+        scheduler = PipelineScheduler(args.data_dir, args.browser_slots, args.llm_slots)
+        results = await scheduler.run_all(sites)
+
+        print("\nSummary:")
+        for tenant_id, result in results.items():
+            status = f"failed: {result}" if isinstance(result, Exception) else f"saved to {result}"
+            print(f"- {tenant_id}: {status}")
+
+    except Exception as e:
+        print(f"Error occurred: {str(e)}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
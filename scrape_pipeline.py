@@ -1,55 +1,99 @@
+import time
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
 import asyncio
+from contextlib import nullcontext
 from pathlib import Path
+from typing import AsyncContextManager, Callable, Optional, TYPE_CHECKING
 import json
 from scrapper import WebScraper
 from preprocess import DataProcessor
 from chatbot_data import ChatbotDatasetGenerator
+from tenants import TenantStorage
+
+if TYPE_CHECKING:
+    from scheduler import FairSlotPool
 
 class WebsiteChatbotPipeline:
-    def __init__(self, url: str):
+    def __init__(self, url: str, tenant_id: Optional[str] = None, base_dir: Path = Path("data")):
         self.url = url
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
-        
-    async def run(self):
+        self.tenant_id = tenant_id
+        self.storage = TenantStorage(base_dir, tenant_id)
+        self.data_dir = self.storage.ensure_dir()
+
+    def _log(self, message: str):
+        print(f"[{self.tenant_id}] {message}" if self.tenant_id else message)
+
+    def _slot(self, pool: Optional["FairSlotPool"]) -> Callable[[], AsyncContextManager]:
+        if pool is None:
+            return nullcontext
+        return lambda: pool.slot(self.tenant_id)
+
+    def _process_data(self, scraped_data_path: Path) -> Path:
+        """Load, structure and save the scraped data; run in a worker thread"""
+        processor = DataProcessor(scraped_data_path)
+        structured_data = processor.process_for_chatgpt()
+        processed_data_path = self.storage.processed_data_path
+        processor.save_processed_data(structured_data, processed_data_path)
+        return processed_data_path
+
+    async def run(self, browser_slots: Optional["FairSlotPool"] = None,
+                  llm_slots: Optional["FairSlotPool"] = None):
+        """Scrape, process and generate the dataset for this site.
+
+        When the pipeline runs under a scheduler, ``browser_slots`` and
+        ``llm_slots`` bound how many browsers and LLM requests are in flight.
+        """
         try:
             # Step 1: Scrape website
-            print(f"\n1. Scraping website: {self.url}")
-            scraper = await WebScraper.create()
-            scraped_data_path = await scraper.scrape_website(self.url)
-            print(f"Scraping completed. Data saved to: {scraped_data_path}")
+            self._log(f"1. Scraping website: {self.url}")
+            async with self._slot(browser_slots)():
+                scraper = await WebScraper.create()
+                try:
+                    scraped_data_path = await scraper.scrape_website(
+                        self.url, self.storage.scraped_data_path
+                    )
+                finally:
+                    await scraper.close()
+            self._log(f"Scraping completed. Data saved to: {scraped_data_path}")
             
             # Step 2: Process data
-            print("\n2. Processing scraped data...")
-            processor = DataProcessor(scraped_data_path)
-            structured_data = processor.process_for_chatgpt()
-            processed_data_path = self.data_dir / "processed_data.json"
-            processor.save_processed_data(structured_data, processed_data_path)
-            print(f"Processing completed. Data saved to: {processed_data_path}")
+            self._log("2. Processing scraped data...")
+            processed_data_path = await asyncio.to_thread(self._process_data, scraped_data_path)
+            self._log(f"Processing completed. Data saved to: {processed_data_path}")
             
             # Step 3: Generate chatbot dataset
-            print("\n3. Generating chatbot dataset...")
-            generator = ChatbotDatasetGenerator(processed_data_path)
-            dataset = generator.generate_categorized_dataset()
-            dataset_path = self.data_dir / "chatbot_dataset.json"
-            generator.save_categorized_dataset(dataset, dataset_path)
-            print(f"Dataset generation completed. Saved to: {dataset_path}")
+            self._log("3. Generating chatbot dataset...")
+            generator = await asyncio.to_thread(ChatbotDatasetGenerator, processed_data_path)
+            dataset = await generator.agenerate_categorized_dataset(self._slot(llm_slots))
+            dataset_path = self.storage.dataset_path
+            await asyncio.to_thread(generator.save_categorized_dataset, dataset, dataset_path)
+            self._log(f"Dataset generation completed. Saved to: {dataset_path}")
             
-            print("\nPipeline completed successfully!")
+            self._log("Pipeline completed successfully!")
             return dataset_path
             
         except Exception as e:
-            print(f"Pipeline error: {str(e)}")
+            self._log(f"Pipeline error: {str(e)}")
             raise
-        
-        finally:
-            if 'scraper' in locals():
-                await scraper.close()
 
 async def main():
+    parser = argparse.ArgumentParser(description="Scrape a website and build its chatbot dataset")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="measure time until the pipeline is ready to prompt for a URL, then exit "
+                             "(counted from script import; interpreter boot is excluded)")
+    parser.add_argument("--tenant", help="store this site's files under data/tenants/<tenant>")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    args = parser.parse_args()
+    if args.startup_time:
+        print(f"Pipeline ready in {(time.perf_counter() - _PROCESS_START) * 1000:.1f} ms")
+        return
+
     try:
         url = input("Enter the website URL to scrape: ")
-        pipeline = WebsiteChatbotPipeline(url)
+        pipeline = WebsiteChatbotPipeline(url, tenant_id=args.tenant, base_dir=args.data_dir)
         await pipeline.run()
         
     except Exception as e:
@@ -1,17 +1,19 @@
-from playwright.async_api import async_playwright
+import asyncio
 import json
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+from tenants import TenantStorage
 
 class WebScraper:
     def __init__(self):
         self.playwright = None
         self.browser = None
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
 
     async def initialize(self):
+        # Imported here so Playwright is only loaded once scraping actually starts
+        from playwright.async_api import async_playwright
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch()
         return self
@@ -22,10 +24,7 @@ class WebScraper:
         await scraper.initialize()
         return scraper
 
-    def _generate_filename(self):
-        return "scraped_data.json"
-
-    async def scrape_website(self, url):
+    async def scrape_website(self, url, output_path: Optional[Path] = None):
         page = await self.browser.new_page()
         await page.goto(url)
         
@@ -131,13 +130,19 @@ class WebScraper:
             'url': url
         }
 
-        filepath = self.data_dir / self._generate_filename()
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(site_data, f, indent=2)
+        filepath = Path(output_path or TenantStorage().scraped_data_path)
+        # Dumping the full DOM is slow, keep it off the event loop
+        await asyncio.to_thread(self._save_scraped_data, site_data, filepath)
 
         await page.close()
         return filepath
 
+    @staticmethod
+    def _save_scraped_data(site_data, filepath: Path):
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(site_data, f, indent=2)
+
     async def close(self):
         await self.browser.close()
         await self.playwright.stop()
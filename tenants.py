@@ -0,0 +1,42 @@
+from typing import Optional
+import re
+from pathlib import Path
+
+TENANT_ID_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$')
+
+def validate_tenant_id(tenant_id: str) -> str:
+    """Reject tenant ids that could escape the tenant directory"""
+    if not TENANT_ID_PATTERN.match(tenant_id):
+        raise ValueError(f"Invalid tenant id: {tenant_id!r}")
+    return tenant_id
+
+class TenantStorage:
+    """Resolves where a site's pipeline files live.
+
+    Without a tenant id the files stay directly in ``base_dir`` as before;
+    each tenant gets its own ``base_dir/tenants/<tenant_id>`` directory.
+    """
+
+    def __init__(self, base_dir: Path = Path("data"), tenant_id: Optional[str] = None):
+        self.base_dir = Path(base_dir)
+        self.tenant_id = validate_tenant_id(tenant_id) if tenant_id is not None else None
+        if self.tenant_id is None:
+            self.data_dir = self.base_dir
+        else:
+            self.data_dir = self.base_dir / "tenants" / self.tenant_id
+
+    @property
+    def scraped_data_path(self) -> Path:
+        return self.data_dir / "scraped_data.json"
+
+    @property
+    def processed_data_path(self) -> Path:
+        return self.data_dir / "processed_data.json"
+
+    @property
+    def dataset_path(self) -> Path:
+        return self.data_dir / "chatbot_dataset.json"
+
+    def ensure_dir(self) -> Path:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        return self.data_dir
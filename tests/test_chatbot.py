@@ -0,0 +1,127 @@
+import threading
+import time
+import pytest
+import chatbot
+from chatbot import DatasetRegistry
+
+class FakeChatbot:
+    loads = 0
+    loads_lock = threading.Lock()
+
+    def __init__(self, dataset_path):
+        with FakeChatbot.loads_lock:
+            FakeChatbot.loads += 1
+        time.sleep(0.05)
+        self.dataset_path = dataset_path
+
+@pytest.fixture
+def fake_chatbot(monkeypatch):
+    FakeChatbot.loads = 0
+    monkeypatch.setattr(chatbot, "WebsiteChatbot", FakeChatbot)
+    return FakeChatbot
+
+def test_registry_evicts_least_recently_used(tmp_path, fake_chatbot):
+    registry = DatasetRegistry(tmp_path, max_loaded=2)
+    registry.get('a')
+    registry.get('b')
+    registry.get('a')
+    registry.get('c')
+    assert registry.loaded_tenants() == ['a', 'c']
+
+    registry.get('b')
+    assert registry.loaded_tenants() == ['c', 'b']
+    assert fake_chatbot.loads == 4
+
+def test_registry_evict_forces_reload(tmp_path, fake_chatbot):
+    registry = DatasetRegistry(tmp_path)
+    first = registry.get('a')
+    assert registry.evict('a')
+    assert not registry.evict('a')
+    assert registry.get('a') is not first
+
+def test_registry_loads_cold_tenant_once(tmp_path, fake_chatbot):
+    registry = DatasetRegistry(tmp_path)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get('a'))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fake_chatbot.loads == 1
+    assert all(result is results[0] for result in results)
+
+def test_registry_loads_dataset_from_tenant_dir(tmp_path):
+    dataset_dir = tmp_path / "tenants" / "acme"
+    dataset_dir.mkdir(parents=True)
+    (dataset_dir / "chatbot_dataset.json").write_text(
+        '{"metadata": {"categories": ["services"]}, "categories": {"services": []}}'
+    )
+    registry = DatasetRegistry(tmp_path)
+    assert registry.get('acme').categories == ['services']
+
+def test_registry_rejects_unsafe_tenant_id(tmp_path):
+    with pytest.raises(ValueError):
+        DatasetRegistry(tmp_path).get('../acme')
+
+class ProbingLock:
+    """Registry lock that runs ``probe`` each time the owning thread releases it"""
+
+    def __init__(self, probe):
+        self._lock = threading.Lock()
+        self._probe = probe
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+        self._probe()
+
+def test_registry_has_no_gap_between_loading_and_publishing(tmp_path, monkeypatch):
+    loader = threading.current_thread()
+
+    class InstantChatbot:
+        loads = 0
+        loaded_by_loader = False
+
+        def __init__(self, dataset_path):
+            InstantChatbot.loads += 1
+            if threading.current_thread() is loader:
+                InstantChatbot.loaded_by_loader = True
+
+    monkeypatch.setattr(chatbot, "WebsiteChatbot", InstantChatbot)
+    registry = DatasetRegistry(tmp_path)
+    probes = []
+
+    def probe():
+        # Once the loader holds its chatbot, fire a competing request at every
+        # point where it drops the registry lock; the request must either find
+        # the chatbot or wait for the load, never load the dataset again
+        if threading.current_thread() is not loader or not InstantChatbot.loaded_by_loader:
+            return
+        thread = threading.Thread(target=registry.get, args=('a',))
+        thread.start()
+        thread.join(0.2)
+        probes.append(thread)
+
+    registry._lock = ProbingLock(probe)
+    registry.get('a')
+    for thread in probes:
+        thread.join()
+
+    assert probes
+    assert InstantChatbot.loads == 1
+
+def test_registry_retries_after_failed_load(tmp_path):
+    registry = DatasetRegistry(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        registry.get('acme')
+    assert registry._loading == {}
+
+    dataset_dir = tmp_path / "tenants" / "acme"
+    dataset_dir.mkdir(parents=True)
+    (dataset_dir / "chatbot_dataset.json").write_text('{"metadata": {}, "categories": {}}')
+    assert registry.loaded_tenants() == []
+    registry.get('acme')
+    assert registry.loaded_tenants() == ['acme']
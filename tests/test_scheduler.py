@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from scheduler import FairSlotPool
+
+async def _use_slot(pool, tenant_id, order, started=None):
+    async with pool.slot(tenant_id):
+        order.append(tenant_id)
+        if started is not None:
+            started.set()
+        await asyncio.sleep(0.01)
+
+def test_pool_rejects_empty_size():
+    with pytest.raises(ValueError):
+        FairSlotPool(0)
+
+def test_freed_slots_rotate_between_tenants():
+    async def scenario():
+        pool = FairSlotPool(1)
+        order = []
+        tasks = [asyncio.create_task(_use_slot(pool, 'a', order)) for _ in range(4)]
+        tasks += [asyncio.create_task(_use_slot(pool, 'b', order)) for _ in range(2)]
+        await asyncio.gather(*tasks)
+        return order, pool.in_use
+
+    order, in_use = asyncio.run(scenario())
+    # 'a' takes the free slot, then waiting tenants alternate
+    assert order == ['a', 'a', 'b', 'a', 'b', 'a']
+    assert in_use == 0
+
+def test_cancelled_waiter_is_skipped():
+    async def scenario():
+        pool = FairSlotPool(1)
+        order = []
+        holder = asyncio.create_task(_use_slot(pool, 'a', order))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(_use_slot(pool, 'b', order))
+        waiter = asyncio.create_task(_use_slot(pool, 'c', order))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(holder, waiter)
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return order, pool.in_use
+
+    order, in_use = asyncio.run(scenario())
+    assert order == ['a', 'c']
+    assert in_use == 0
+
+def test_cancel_after_handoff_passes_slot_on():
+    async def scenario():
+        pool = FairSlotPool(1)
+        order = []
+        await pool.acquire('a')
+        handed_over = asyncio.create_task(pool.acquire('b'))
+        waiter = asyncio.create_task(_use_slot(pool, 'c', order))
+        await asyncio.sleep(0)
+        # Grant the slot to 'b' and cancel it before it resumes
+        pool.release()
+        handed_over.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await handed_over
+        await waiter
+        return order, pool.in_use
+
+    order, in_use = asyncio.run(scenario())
+    assert order == ['c']
+    assert in_use == 0
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from pathlib import Path
+import chatbot
+from chatbot import WebsiteChatbot
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Records import attempts too, so the check holds even where the packages are missing
+IMPORT_PROBE = '''
+import sys
+HEAVY = {"groq", "dotenv", "playwright"}
+attempted = []
+
+class Recorder:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in HEAVY:
+            attempted.append(name)
+        return None
+
+sys.meta_path.insert(0, Recorder())
+import chatbot
+import scrape_pipeline
+loaded = sorted(name for name in sys.modules if name.split(".")[0] in HEAVY)
+print(sorted(set(attempted)), loaded)
+'''
+
+def test_entry_points_do_not_import_heavy_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[] []"
+
+def test_warm_up_keeps_client_error(tmp_path, monkeypatch):
+    error = RuntimeError("GROQ_API_KEY is not set")
+
+    def failing_client():
+        raise error
+
+    monkeypatch.setattr(chatbot, "get_groq_client", failing_client)
+    dataset_path = tmp_path / "chatbot_dataset.json"
+    dataset_path.write_text('{"metadata": {}, "categories": {}}')
+
+    thread = WebsiteChatbot(dataset_path).warm_up()
+    thread.join()
+
+    assert thread.error is error